@@ -5,24 +5,20 @@ Handles the execution of commands from transcribed speech.
 """
 
 import os
+import re
 import pyautogui
 import threading
 import json
 import time
 from dotenv import load_dotenv
 
-from pydantic import BaseModel
-from typing import Literal, Dict, Any
+from typing import Dict, Any
 
 from computer_use_utils import bring_to_front_window, detect_ide_with_gemini, get_active_window_monitor, get_coordinates_for_prompt, get_current_window_name
 from utils import play_beep, enhance_user_prompt
 
 load_dotenv()
 
-class EnhancedPrompt(BaseModel):
-    prompt: str
-    requiredIntelligenceLevel: Literal["low", "medium", "high"]
-
 class CommandProcessor:
     """
     Processes commands received from transcribed speech.
@@ -191,7 +187,7 @@ class CommandProcessor:
         
         if target_interface not in self.interface_config.keys():
             print(f"Unknown interface: '{target_interface}'. Valid options are {self.interface_config.keys()}")
-            play_beep(1200, 1000)  # Error beep
+            play_beep(1200, 1000, wait=True)  # Error beep
             return False
         
         project_name = " ".join(change_params[1:])
@@ -228,7 +224,7 @@ class CommandProcessor:
             return True
         else:
             print(f"Error: Could not initialize {target_interface} interface")
-            play_beep(1200, 1000)
+            play_beep(1200, 1000, wait=True)
             return False
             
         
@@ -266,7 +262,7 @@ class CommandProcessor:
                 if not enhanced_prompt.prompt or enhanced_prompt.prompt == 'None':
                     print("Invalid coding prompt - please provide a prompt that makes sense for coding tasks :D")
                     # play sound to notify user
-                    play_beep(1200, 1000)
+                    play_beep(1200, 1000, wait=True)
                     if completion_callback:
                         completion_callback()  # Return to listening mode even on error
                     return False
@@ -281,7 +277,7 @@ class CommandProcessor:
                 pyautogui.press("enter")
             else:
                 print(f"Error: No coordinates found for {command_type} in {self.current_interface} interface")
-                play_beep(1200, 1000)
+                play_beep(1200, 1000, wait=True)
                 if completion_callback:
                     completion_callback()  # Return to listening mode even on error
                 return False
@@ -310,7 +306,7 @@ class CommandProcessor:
             command_params = command_params.split(" ")[0]
             if command_params not in self.buttons:
                 print(f"Error: No button named '{command_params}' has been learned")
-                play_beep(1200, 1000)
+                play_beep(1200, 1000, wait=True)
                 if completion_callback:
                     completion_callback()  # Return to listening mode even on error
                 return False
@@ -325,7 +321,7 @@ class CommandProcessor:
             btn_selector = " ".join(command_params.split(" ")[1:])
             if not btn_name or not btn_selector:
                 print(f"Error: Invalid learn command format. Use 'learn button_name selector text'")
-                play_beep(1200, 1000)
+                play_beep(1200, 1000, wait=True)
                 if completion_callback:
                     completion_callback()  # Return to listening mode even on error
                 return False
@@ -339,7 +335,7 @@ class CommandProcessor:
                 return True
             else:
                 print(f"Error: Could not find coordinates for '{btn_selector}'")
-                play_beep(1200, 1000)
+                play_beep(1200, 1000, wait=True)
                 if completion_callback:
                     completion_callback()  # Return to listening mode even on error
                 return False
@@ -373,6 +369,10 @@ class CommandQueue:
             command_processor: An optional CommandProcessor instance to execute commands
         """
         self.activation_word = activation_word.lower()
+        # Whole word only
+        self.activation_pattern = re.compile(
+            rf"\b{re.escape(self.activation_word)}\b", re.IGNORECASE
+        )
         self.command_processor = command_processor or CommandProcessor()
         self.audio_handler = None  # Will be set by FastSpeechHandler
         
@@ -398,12 +398,10 @@ class CommandQueue:
         """
         commands = []
         
-        # Check for activation word
-        # Split text into words and check if activation word exists as a separate word
-        if self.activation_word in text.lower().split():
-            # Split the text by the activation word
-            parts = text.split(self.activation_word)
-            
+        # Check for activation word as a separate word, splitting the text around
+        # every occurrence in a single regex pass
+        parts = self.activation_pattern.split(text)
+        if len(parts) > 1:
             # Process each part after an activation word
             commands_found = False
             
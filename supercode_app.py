@@ -11,6 +11,8 @@ import os
 import socket
 import sys
 import errno
+import traceback
+import pyaudio
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -80,6 +82,15 @@ class SuperCodeApp(rumps.App):
         self.handler = None
         self.keyboard_listener = None
         self.current_interface = "SuperCode"  # Track the current interface
+        self.warm_audio = None  # PyAudio instance initialized while the session is being set up
+        self.prewarm_thread = None
+        
+        # Transcription service settings don't change during the app's lifetime
+        self.use_openai_api = os.getenv("USE_OPENAI_API", "false").lower() == "true"
+        if self.use_openai_api:
+            self.service_name = "OpenAI Whisper API"
+        else:
+            self.service_name = "Google Speech Recognition"
         
         # Use our new overlay manager instead of direct overlay
         self.overlay_manager = OverlayManager()
@@ -100,6 +111,33 @@ class SuperCodeApp(rumps.App):
         # Set up global keyboard shortcut
         self.setup_global_shortcut()
     
+    def prewarm_audio(self):
+        """Initialize PortAudio in a background thread while the listening session is set up"""
+        # PortAudio snapshots the device list when it initializes, so never reuse an instance
+        # left over from an earlier, aborted start - the default mic may have changed since
+        stale_audio = self.take_warm_audio()
+        if stale_audio:
+            stale_audio.terminate()
+        
+        self.prewarm_thread = threading.Thread(target=self._prewarm_audio_worker)
+        self.prewarm_thread.daemon = True
+        self.prewarm_thread.start()
+    
+    def _prewarm_audio_worker(self):
+        """Create the PyAudio instance used by the next speech handler"""
+        try:
+            self.warm_audio = pyaudio.PyAudio()
+        except Exception as e:
+            print(f"Error pre-warming audio: {e}")
+    
+    def take_warm_audio(self):
+        """Hand over the pre-warmed PyAudio instance, waiting for it if it's still initializing"""
+        if self.prewarm_thread:
+            self.prewarm_thread.join()
+        audio = self.warm_audio
+        self.warm_audio = None
+        return audio
+    
     def setup_global_shortcut(self):
         """Set up global keyboard shortcut (Command + Option + L)"""
         try:
@@ -160,7 +198,6 @@ class SuperCodeApp(rumps.App):
                 print("pynput not available, global shortcut disabled")
         except Exception as e:
             print(f"Error setting up global shortcut: {e}")
-            import traceback
             traceback.print_exc()
     
     def on_hotkey_activated(self):
@@ -184,14 +221,12 @@ class SuperCodeApp(rumps.App):
         if self.is_listening:
             self.stop_listening()
             sender.title = "Start Listening"
-            self.title = "SuperCode"
             
             # Hide the overlay when stopping
             self.hide_overlay()
         else:
             self.start_listening()
             sender.title = "Stop Listening"
-            self.title = "SuperCode"
             
             # Always show the overlay when starting
             self.show_overlay()
@@ -203,7 +238,6 @@ class SuperCodeApp(rumps.App):
             self.overlay_manager.show_overlay()
         except Exception as e:
             print(f"Error showing overlay: {e}")
-            import traceback
             traceback.print_exc()
     
     def hide_overlay(self):
@@ -212,7 +246,6 @@ class SuperCodeApp(rumps.App):
             self.overlay_manager.hide_overlay()
         except Exception as e:
             print(f"Error hiding overlay: {e}")
-            import traceback
             traceback.print_exc()
             
     def start_listening(self):
@@ -228,6 +261,10 @@ class SuperCodeApp(rumps.App):
         # Set initializing status
         self.overlay_manager.update_status(self.overlay_manager.STATUS_INITIALIZING, "Preparing microphone...")
         
+        # Initialize PortAudio in the background while we check for the IDE;
+        # it sees the current devices
+        self.prewarm_audio()
+        
         # First initialize the interface to make sure the IDE is open and focused
         try:            
             # Try to initialize the interface (default one)
@@ -283,13 +320,13 @@ class SuperCodeApp(rumps.App):
         self.listen_thread.daemon = True
         self.listen_thread.start()
         
-        # Get transcription service info
-        use_openai_api = os.getenv("USE_OPENAI_API", "false").lower() == "true"
-        service_name = "OpenAI Whisper API" if use_openai_api else "Google Speech Recognition"
-        
         # The handler will set the status to idle when fully ready
         
-        rumps.notification("SuperCode", f"Voice Recognition Active ({service_name})", "Say commands starting with 'activate'")
+        rumps.notification(
+            "SuperCode",
+            f"Voice Recognition Active ({self.service_name})",
+            "Say commands starting with 'activate'"
+        )
     
     def stop_listening(self):
         """Stop listening for voice commands"""
@@ -320,7 +357,8 @@ class SuperCodeApp(rumps.App):
                 silence_duration=3,
                 command_processor=command_processor,
                 overlay=self.overlay_manager,
-                stop_callback=self.stop_from_voice_command
+                stop_callback=self.stop_from_voice_command,
+                audio=self.take_warm_audio()
             )
             
             # Log which service is being used
@@ -330,13 +368,11 @@ class SuperCodeApp(rumps.App):
             # Start the handler
             listen_thread = self.handler.start()
             
-            # Keep the thread running until we stop listening
-            while self.is_listening and listen_thread.is_alive():
-                time.sleep(0.1)
+            # Block until the capture thread exits (stop() ends it) instead of polling
+            listen_thread.join()
                 
         except Exception as e:
             print(f"Error in whisper handler: {str(e)}")
-            import traceback
             traceback.print_exc()
             
             # Show error notification
@@ -357,8 +393,6 @@ class SuperCodeApp(rumps.App):
                     item.title = "Start Listening"
                     break
                     
-            self.title = "SuperCode"
-            
             # Stop listening
             self.stop_listening()
     
@@ -394,8 +428,6 @@ Example: Say "activate type hello world"
                     item.title = "Start Listening"
                     break
                     
-            self.title = "SuperCode"
-            
             # Stop listening
             self.stop_listening()
         else:
@@ -413,8 +445,6 @@ Example: Say "activate type hello world"
                     item.title = "Stop Listening"
                     break
                     
-            self.title = "SuperCode"
-            
             # Start listening
             self.start_listening()
 
@@ -437,6 +467,10 @@ Example: Say "activate type hello world"
         # Stop keyboard listener if active
         if self.keyboard_listener:
             self.keyboard_listener.stop()
+        # Release the pre-warmed audio instance if it was never used
+        audio = self.take_warm_audio()
+        if audio:
+            audio.terminate()
 
     def set_current_interface(self, interface_name):
         """Set the current interface name and update the overlay"""
@@ -465,7 +499,14 @@ class EnhancedCommandProcessor(CommandProcessor):
         
         # Show a notification
         if result:
-            rumps.notification("SuperCode", "Command Executed", command_text)
+            # Notifications round-trip through the macOS notification center;
+            # post off the command path
+            notification_thread = threading.Thread(
+                target=rumps.notification,
+                args=("SuperCode", "Command Executed", command_text)
+            )
+            notification_thread.daemon = True
+            notification_thread.start()
             
             # Reset overlay status if available
             if self.overlay_manager:
@@ -476,8 +517,9 @@ class EnhancedCommandProcessor(CommandProcessor):
 
 # Enhanced speech handler that updates the overlay
 class EnhancedSpeechHandler(FastSpeechHandler):
-    def __init__(self, activation_word="activate", silence_duration=0.8, command_processor=None, overlay=None, stop_callback=None):
-        super().__init__(activation_word, silence_duration, command_processor)
+    def __init__(self, activation_word="activate", silence_duration=0.8, command_processor=None,
+                 overlay=None, stop_callback=None, audio=None):
+        super().__init__(activation_word, silence_duration, command_processor, audio)
         self.overlay_manager = overlay  # This is the overlay_manager
         self.audio_data_buffer = []
         self.stop_callback = stop_callback  # Callback to stop listening completely
@@ -525,7 +567,7 @@ class EnhancedSpeechHandler(FastSpeechHandler):
     def _after_stream_close(self):
         """Hook called after the audio stream is closed"""
         # Reset overlay status if we're still running
-        if not self.should_stop and self.overlay_manager:
+        if not self.stop_event.is_set() and self.overlay_manager:
             self.overlay_manager.update_status(self.overlay_manager.STATUS_IDLE)
     
     def _on_initialization_error(self, error):
@@ -544,11 +586,8 @@ class EnhancedSpeechHandler(FastSpeechHandler):
     # Override process_recognized_text to update overlay
     def _process_recognized_text(self, text):
         """Process recognized text and update overlay"""
-        # Convert text to lowercase for consistent command detection
-        text_lower = text.lower()
-        
-        # Check for stop command
-        if self.activation_word in text_lower:
+        # Only handle text with the activation word as a whole word, e.g. not "supercoder"
+        if self.command_queue.activation_pattern.search(text):
             # Process text and execute any commands found
             commands = self.command_queue.process_text(text)
             
@@ -724,7 +763,6 @@ def main():
         
     except Exception as e:
         print(f"Error initializing SuperCode: {str(e)}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,20 +1,73 @@
 import platform
 import subprocess
+import threading
 from openai import OpenAI
 from pydantic import BaseModel
 from typing import Literal
 import os
-import glob
+import re
+import fnmatch
+import heapq
 
-def play_beep(frequency, duration):
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        subprocess.call(["afplay", "/System/Library/Sounds/Ping.aiff"])
-    elif system == "Linux":
-        subprocess.call(["paplay", "/usr/share/sounds/freedesktop/stereo/bell.oga"])
-    elif system == "Windows":
-        import winsound
-        winsound.Beep(frequency, duration)  # frequency in Hz, duration in milliseconds
+# Resolve the platform's beep command once instead of on every beep
+_SYSTEM = platform.system()
+if _SYSTEM == "Darwin":  # macOS
+    _BEEP_COMMAND = ["afplay", "/System/Library/Sounds/Ping.aiff"]
+elif _SYSTEM == "Linux":
+    _BEEP_COMMAND = ["paplay", "/usr/share/sounds/freedesktop/stereo/bell.oga"]
+else:
+    _BEEP_COMMAND = None
+
+if _SYSTEM == "Windows":
+    import winsound
+    _WINDOWS_BEEP = winsound.Beep
+else:
+    _WINDOWS_BEEP = None
+
+def play_beep(frequency, duration, wait=False):
+    """
+    Play a short system beep.
+    
+    Args:
+        frequency: Beep frequency in Hz (Windows only)
+        duration: Beep duration in milliseconds (Windows only)
+        wait: Block until the sound has finished. Use this when the caller resumes
+              listening right after, so the mic doesn't record the beep (default: False)
+    """
+    if _BEEP_COMMAND:
+        # Fire and forget unless asked to wait - don't hold up the caller for the sound
+        beep_process = subprocess.Popen(
+            _BEEP_COMMAND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if wait:
+            beep_process.wait()
+    elif _WINDOWS_BEEP:
+        # frequency in Hz, duration in milliseconds
+        if wait:
+            _WINDOWS_BEEP(frequency, duration)
+        else:
+            beep_thread = threading.Thread(target=_WINDOWS_BEEP, args=(frequency, duration))
+            beep_thread.daemon = True
+            beep_thread.start()
+
+class EnhancedPrompt(BaseModel):
+    prompt: str
+    requiredIntelligenceLevel: Literal["low", "medium", "high"]
+
+# Reuse one OpenAI client (and its connection pool) across prompt enhancements
+_openai_client = None
+
+def _get_openai_client():
+    """
+    Get the shared OpenAI client, creating it on first use.
+    
+    Returns:
+        OpenAI: The shared client instance.
+    """
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI()
+    return _openai_client
 
 def enhance_user_prompt(command_text):
     """
@@ -26,12 +79,8 @@ def enhance_user_prompt(command_text):
     Returns:
         str: The enhanced, structured prompt.
     """
-    class EnhancedPrompt(BaseModel):
-        prompt: str
-        requiredIntelligenceLevel: Literal["low", "medium", "high"]
-
     try:
-        client = OpenAI()
+        client = _get_openai_client()
         
         system_prompt = """You are a prompt engineering assistant. Your task is to transform raw, unstructured prompts 
         into short prompts specifically designed for coding models and IDEs like Copilot and Windsurf.
@@ -75,30 +124,31 @@ def cleanup_old_files(directory, pattern, max_files=10):
         pattern (str): Glob pattern to match files (e.g., "*.wav", "*.png")
         max_files (int): Maximum number of files to keep (default: 10)
     """
-    if not os.path.exists(directory):
+    # List all matching files with their modification times in a single directory pass
+    try:
+        with os.scandir(directory) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries
+                     if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)]
+    except FileNotFoundError:
         return
-        
-    # List all matching files with their full paths
-    files = glob.glob(os.path.join(directory, pattern))
-    
-    # Sort files by modification time (newest last)
-    files.sort(key=os.path.getmtime)
     
     # Remove oldest files if we have more than max_files
     if len(files) > max_files:
-        files_to_remove = files[:-max_files]  # Keep the newest max_files
-        for file_path in files_to_remove:
+        # Select only the oldest files beyond the newest max_files, without sorting everything
+        files_to_remove = heapq.nsmallest(len(files) - max_files, files)
+        for _, file_path in files_to_remove:
             try:
                 os.remove(file_path)
             except Exception as e:
                 print(f"Error removing file {file_path}: {e}")
 
+# Fenced code blocks in LLM responses, preferring an explicit ```json block
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)```", re.DOTALL)
+
 def extract_json_content(response_text):
     # Look for JSON content between triple backticks if present
-    if "```json" in response_text and "```" in response_text.split("```json", 1)[1]:
-        json_content = response_text.split("```json", 1)[1].split("```", 1)[0].strip()
-    elif "```" in response_text and "```" in response_text.split("```", 1)[1]:
-        json_content = response_text.split("```", 1)[1].split("```", 1)[0].strip()
-    else:
-        json_content = response_text
-    return json_content
\ No newline at end of file
+    match = _JSON_FENCE_RE.search(response_text) or _FENCE_RE.search(response_text)
+    if match:
+        return match.group(1).strip()
+    return response_text
\ No newline at end of file